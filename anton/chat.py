@@ -251,12 +251,14 @@ async def _handle_connect(
             ds_engine = "unknown"
 
     # --- Persist to global ~/.anton/.env ---
-    global_ws.set_secret("ANTON_MINDS_API_KEY", api_key)
-    global_ws.set_secret("ANTON_MINDS_URL", minds_url)
-    global_ws.set_secret("ANTON_MINDS_MIND_NAME", mind_name)
-    global_ws.set_secret("ANTON_MINDS_DATASOURCE", ds_name)
-    global_ws.set_secret("ANTON_MINDS_DATASOURCE_ENGINE", ds_engine)
-    global_ws.set_secret("ANTON_MINDS_SSL_VERIFY", "true" if ssl_verify else "false")
+    global_ws.set_secrets({
+        "ANTON_MINDS_API_KEY": api_key,
+        "ANTON_MINDS_URL": minds_url,
+        "ANTON_MINDS_MIND_NAME": mind_name,
+        "ANTON_MINDS_DATASOURCE": ds_name,
+        "ANTON_MINDS_DATASOURCE_ENGINE": ds_engine,
+        "ANTON_MINDS_SSL_VERIFY": "true" if ssl_verify else "false",
+    })
 
     settings.minds_api_key = api_key
     settings.minds_url = minds_url
@@ -286,10 +288,12 @@ async def _handle_connect(
         # openai_api_key and openai_base_url are derived at runtime from
         # minds_api_key and minds_url via model_post_init — no need to persist them.
         settings.model_post_init(None)
-        global_ws.set_secret("ANTON_PLANNING_PROVIDER", "openai-compatible")
-        global_ws.set_secret("ANTON_CODING_PROVIDER", "openai-compatible")
-        global_ws.set_secret("ANTON_PLANNING_MODEL", "_reason_")
-        global_ws.set_secret("ANTON_CODING_MODEL", "_code_")
+        global_ws.set_secrets({
+            "ANTON_PLANNING_PROVIDER": "openai-compatible",
+            "ANTON_CODING_PROVIDER": "openai-compatible",
+            "ANTON_PLANNING_MODEL": "_reason_",
+            "ANTON_CODING_MODEL": "_code_",
+        })
     else:
         # Check if Anthropic key is already configured
         has_anthropic = settings.anthropic_api_key or os.environ.get(
@@ -304,11 +308,13 @@ async def _handle_connect(
                 settings.coding_provider = "anthropic"
                 settings.planning_model = "claude-sonnet-4-6"
                 settings.coding_model = "claude-haiku-4-5-20251001"
-                global_ws.set_secret("ANTON_ANTHROPIC_API_KEY", anthropic_key)
-                global_ws.set_secret("ANTON_PLANNING_PROVIDER", "anthropic")
-                global_ws.set_secret("ANTON_CODING_PROVIDER", "anthropic")
-                global_ws.set_secret("ANTON_PLANNING_MODEL", "claude-sonnet-4-6")
-                global_ws.set_secret("ANTON_CODING_MODEL", "claude-haiku-4-5-20251001")
+                global_ws.set_secrets({
+                    "ANTON_ANTHROPIC_API_KEY": anthropic_key,
+                    "ANTON_PLANNING_PROVIDER": "anthropic",
+                    "ANTON_CODING_PROVIDER": "anthropic",
+                    "ANTON_PLANNING_MODEL": "claude-sonnet-4-6",
+                    "ANTON_CODING_MODEL": "claude-haiku-4-5-20251001",
+                })
                 console.print("[anton.success]Anthropic API key saved.[/]")
             else:
                 console.print(
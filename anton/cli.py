@@ -737,8 +737,10 @@ def _setup_minds(settings, ws, *, default_url: str | None = "https://api.mindshu
     # Store Minds credentials
     settings.minds_api_key = api_key
     settings.minds_url = minds_url
-    ws.set_secret("ANTON_MINDS_API_KEY", api_key)
-    ws.set_secret("ANTON_MINDS_URL", minds_url)
+    ws.set_secrets({
+        "ANTON_MINDS_API_KEY": api_key,
+        "ANTON_MINDS_URL": minds_url,
+    })
 
     # Test connection with a spinner
 
@@ -780,13 +782,15 @@ def _setup_minds(settings, ws, *, default_url: str | None = "https://api.mindshu
         derived_base_url = f"{minds_url}/v1"
         settings.openai_api_key = api_key
         settings.openai_base_url = derived_base_url
-        ws.set_secret("ANTON_PLANNING_PROVIDER", "openai-compatible")
-        ws.set_secret("ANTON_CODING_PROVIDER", "openai-compatible")
-        ws.set_secret("ANTON_PLANNING_MODEL", "_reason_")
-        ws.set_secret("ANTON_CODING_MODEL", "_code_")
-        ws.set_secret("ANTON_MINDS_SSL_VERIFY", "true" if ssl_verify else "false")
-        ws.set_secret("ANTON_OPENAI_API_KEY", api_key)
-        ws.set_secret("ANTON_OPENAI_BASE_URL", derived_base_url)
+        ws.set_secrets({
+            "ANTON_PLANNING_PROVIDER": "openai-compatible",
+            "ANTON_CODING_PROVIDER": "openai-compatible",
+            "ANTON_PLANNING_MODEL": "_reason_",
+            "ANTON_CODING_MODEL": "_code_",
+            "ANTON_MINDS_SSL_VERIFY": "true" if ssl_verify else "false",
+            "ANTON_OPENAI_API_KEY": api_key,
+            "ANTON_OPENAI_BASE_URL": derived_base_url,
+        })
     elif rate_limited:
         console.print(
             "[anton.error]Token limit exceeded. Visit https://mdb.ai to upgrade or to top up your tokens.[/]"
@@ -836,8 +840,10 @@ def _setup_other_provider(settings, ws) -> None:
 
     settings.minds_url = None
     settings.minds_api_key = None
-    ws.set_secret("ANTON_MINDS_URL", "")
-    ws.set_secret("ANTON_MINDS_API_KEY", "")
+    ws.set_secrets({
+        "ANTON_MINDS_URL": "",
+        "ANTON_MINDS_API_KEY": "",
+    })
 
 
 def _validate_with_spinner(console, label: str, fn) -> None:
@@ -944,11 +950,13 @@ def _setup_anthropic(settings, ws) -> None:
     settings.coding_provider = "anthropic"
     settings.planning_model = model
     settings.coding_model = model
-    ws.set_secret("ANTON_ANTHROPIC_API_KEY", api_key)
-    ws.set_secret("ANTON_PLANNING_PROVIDER", "anthropic")
-    ws.set_secret("ANTON_CODING_PROVIDER", "anthropic")
-    ws.set_secret("ANTON_PLANNING_MODEL", model)
-    ws.set_secret("ANTON_CODING_MODEL", model)
+    ws.set_secrets({
+        "ANTON_ANTHROPIC_API_KEY": api_key,
+        "ANTON_PLANNING_PROVIDER": "anthropic",
+        "ANTON_CODING_PROVIDER": "anthropic",
+        "ANTON_PLANNING_MODEL": model,
+        "ANTON_CODING_MODEL": model,
+    })
 
 
 def _setup_openai(settings, ws) -> None:
@@ -995,12 +1003,14 @@ def _setup_openai(settings, ws) -> None:
     settings.coding_provider = "openai"
     settings.planning_model = model
     settings.coding_model = model
-    ws.set_secret("ANTON_OPENAI_API_KEY", api_key)
-    ws.set_secret("ANTON_OPENAI_BASE_URL", "")
-    ws.set_secret("ANTON_PLANNING_PROVIDER", "openai")
-    ws.set_secret("ANTON_CODING_PROVIDER", "openai")
-    ws.set_secret("ANTON_PLANNING_MODEL", model)
-    ws.set_secret("ANTON_CODING_MODEL", model)
+    ws.set_secrets({
+        "ANTON_OPENAI_API_KEY": api_key,
+        "ANTON_OPENAI_BASE_URL": "",
+        "ANTON_PLANNING_PROVIDER": "openai",
+        "ANTON_CODING_PROVIDER": "openai",
+        "ANTON_PLANNING_MODEL": model,
+        "ANTON_CODING_MODEL": model,
+    })
 
 
 def _setup_gemini(settings, ws) -> None:
@@ -1053,12 +1063,14 @@ def _setup_gemini(settings, ws) -> None:
     settings.coding_provider = "openai-compatible"
     settings.planning_model = model
     settings.coding_model = model
-    ws.set_secret("ANTON_OPENAI_API_KEY", api_key)
-    ws.set_secret("ANTON_OPENAI_BASE_URL", _GEMINI_BASE_URL)
-    ws.set_secret("ANTON_PLANNING_PROVIDER", "openai-compatible")
-    ws.set_secret("ANTON_CODING_PROVIDER", "openai-compatible")
-    ws.set_secret("ANTON_PLANNING_MODEL", model)
-    ws.set_secret("ANTON_CODING_MODEL", model)
+    ws.set_secrets({
+        "ANTON_OPENAI_API_KEY": api_key,
+        "ANTON_OPENAI_BASE_URL": _GEMINI_BASE_URL,
+        "ANTON_PLANNING_PROVIDER": "openai-compatible",
+        "ANTON_CODING_PROVIDER": "openai-compatible",
+        "ANTON_PLANNING_MODEL": model,
+        "ANTON_CODING_MODEL": model,
+    })
 
 
 
@@ -1154,13 +1166,15 @@ def _setup_custom_openai(settings, ws) -> None:
     settings.coding_provider = "openai-compatible"
     settings.planning_model = model
     settings.coding_model = model
-    ws.set_secret("ANTON_OPENAI_API_KEY", api_key)
-    ws.set_secret("ANTON_OPENAI_BASE_URL", base_url)
-    ws.set_secret("ANTON_OPENAI_API_VERSION", api_version or "")
-    ws.set_secret("ANTON_PLANNING_PROVIDER", "openai-compatible")
-    ws.set_secret("ANTON_CODING_PROVIDER", "openai-compatible")
-    ws.set_secret("ANTON_PLANNING_MODEL", model)
-    ws.set_secret("ANTON_CODING_MODEL", model)
+    ws.set_secrets({
+        "ANTON_OPENAI_API_KEY": api_key,
+        "ANTON_OPENAI_BASE_URL": base_url,
+        "ANTON_OPENAI_API_VERSION": api_version or "",
+        "ANTON_PLANNING_PROVIDER": "openai-compatible",
+        "ANTON_CODING_PROVIDER": "openai-compatible",
+        "ANTON_PLANNING_MODEL": model,
+        "ANTON_CODING_MODEL": model,
+    })
 
     # The custom endpoint is generic openai-compatible (i.e. NOT mdb.ai
     # passthrough), so the LLM provider doesn't expose web_search natively.
@@ -1327,8 +1341,10 @@ def _setup_exa(settings, ws) -> None:
 
     settings.external_search_provider = "exa"
     settings.exa_api_key = api_key
-    ws.set_secret("ANTON_EXTERNAL_SEARCH_PROVIDER", "exa")
-    ws.set_secret("ANTON_EXA_API_KEY", api_key)
+    ws.set_secrets({
+        "ANTON_EXTERNAL_SEARCH_PROVIDER": "exa",
+        "ANTON_EXA_API_KEY": api_key,
+    })
     console.print("  [anton.success]Exa.ai configured.[/]")
 
 
@@ -1383,8 +1399,10 @@ def _setup_brave(settings, ws) -> None:
 
     settings.external_search_provider = "brave"
     settings.brave_api_key = api_key
-    ws.set_secret("ANTON_EXTERNAL_SEARCH_PROVIDER", "brave")
-    ws.set_secret("ANTON_BRAVE_API_KEY", api_key)
+    ws.set_secrets({
+        "ANTON_EXTERNAL_SEARCH_PROVIDER": "brave",
+        "ANTON_BRAVE_API_KEY": api_key,
+    })
     console.print("  [anton.success]Brave Search configured.[/]")
 
 
@@ -480,22 +480,17 @@ if _scratchpad_model:
                 if not response.tool_calls:
                     return response.content
 
-                # Build assistant message with text + tool_use blocks
-                assistant_content = []
-                if response.content:
-                    assistant_content.append({"type": "text", "text": response.content})
-                for tc in response.tool_calls:
-                    assistant_content.append(
-                        {
-                            "type": "tool_use",
-                            "id": tc.id,
-                            "name": tc.name,
-                            "input": tc.input,
-                        }
-                    )
-                messages.append({"role": "assistant", "content": assistant_content})
-
-                # Execute each tool and collect results
+                # Assistant turn (text + tool_use blocks) and the matching
+                # tool_result turn are built once and appended together.
+                assistant_content = (
+                    [{"type": "text", "text": response.content}]
+                    if response.content
+                    else []
+                )
+                assistant_content.extend(
+                    {"type": "tool_use", "id": tc.id, "name": tc.name, "input": tc.input}
+                    for tc in response.tool_calls
+                )
                 tool_results = []
                 for tc in response.tool_calls:
                     try:
@@ -503,13 +498,12 @@ if _scratchpad_model:
                     except Exception as exc:
                         result = f"Error: {exc}"
                     tool_results.append(
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tc.id,
-                            "content": result,
-                        }
+                        {"type": "tool_result", "tool_use_id": tc.id, "content": result}
                     )
-                messages.append({"role": "user", "content": tool_results})
+                messages.extend((
+                    {"role": "assistant", "content": assistant_content},
+                    {"role": "user", "content": tool_results},
+                ))
 
             # Hit max_turns
             return response.content if response else ""
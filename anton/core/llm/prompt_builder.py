@@ -19,6 +19,19 @@ if TYPE_CHECKING:
     from anton.core.tools.tool_defs import ToolDef
 
 
+# Fixed lead-in of the procedural-memory section; only the skill lines below
+# it vary between turns.
+_PROCEDURAL_MEMORY_HEADER = (
+    "\n\n## Procedural memory (skills available)\n\n"
+    "These are reusable procedures you've previously refined for "
+    "recurring tasks. When the user's request matches one of "
+    "them, call `recall_skill(label)` to load the full step-by-"
+    "step procedure into your context. You may recall multiple "
+    "skills if the task spans several. If none apply, proceed "
+    "with normal reasoning.\n"
+)
+
+
 @dataclass(frozen=True)
 class SystemPromptContext:
     """Bundled prompt-injection points for the system prompt.
@@ -81,21 +94,7 @@ class ChatSystemPromptBuilder:
         if not summaries:
             return ""
 
-        lines: list[str] = [
-            "",
-            "",
-            "## Procedural memory (skills available)",
-            "",
-            (
-                "These are reusable procedures you've previously refined for "
-                "recurring tasks. When the user's request matches one of "
-                "them, call `recall_skill(label)` to load the full step-by-"
-                "step procedure into your context. You may recall multiple "
-                "skills if the task spans several. If none apply, proceed "
-                "with normal reasoning."
-            ),
-            "",
-        ]
+        lines: list[str] = [_PROCEDURAL_MEMORY_HEADER]
         for s in summaries:
             label = s.get("label", "")
             when = s.get("description", "").strip()
@@ -144,63 +143,65 @@ class ChatSystemPromptBuilder:
             output_dir=output_dir,
         )
 
-        prompt = ""
+        # Sections are collected and joined once at the end — the base prompt
+        # alone is tens of KB, and repeated `+=` would copy it per section.
+        parts: list[str] = []
 
         prefix = system_prompt_context.prefix.strip()
         if prefix:
-            prompt += f"{prefix}\n\n"
+            parts.append(f"{prefix}\n\n")
 
         conversation_discipline = (
             CONVERSATION_DISCIPLINE_ACT_FIRST if act_first
             else CONVERSATION_DISCIPLINE_ASK_FIRST
         )
 
-        prompt += CHAT_SYSTEM_PROMPT.format(
+        parts.append(CHAT_SYSTEM_PROMPT.format(
             runtime_context=system_prompt_context.runtime_context,
             artifacts_section=ARTIFACTS_PROMPT,
             visualizations_section=visualizations_section,
             conversation_discipline=conversation_discipline,
             conversation_started=conversation_started,
-        )
+        ))
 
         # Short pointer only — the full backend/fullstack contract lives in the
         # built-in `build-fullstack-backend` skill (recalled on demand).
-        prompt += "\n\n" + BACKEND_GENERATION_PROMPT
+        parts.append("\n\n" + BACKEND_GENERATION_PROMPT)
 
         tool_prompts = self._build_tool_prompts_section(tool_defs)
         if tool_prompts:
-            prompt += tool_prompts
+            parts.append(tool_prompts)
 
         # Stable, per-session content goes before the volatile tail so the
         # prefix stays cache-stable across turns.
         if project_context:
-            prompt += project_context
+            parts.append(project_context)
         if self_awareness_context:
-            prompt += self_awareness_context
+            parts.append(self_awareness_context)
         if datasource_context:
-            prompt += datasource_context
+            parts.append(datasource_context)
 
         procedural_memory = self._build_procedural_memory_section(skill_store)
         if procedural_memory:
-            prompt += procedural_memory
+            parts.append(procedural_memory)
 
         suffix = system_prompt_context.suffix.strip()
         if suffix:
-            prompt += f"\n\n{suffix}"
+            parts.append(f"\n\n{suffix}")
 
         # Volatile tail — LAST so everything above can be cached. The live
         # clock and the relevance-filtered memory snapshot both change every
         # turn, so they sit after the cache-stable prefix and never invalidate
         # it. (The prefix carries only the fixed "conversation started" stamp.)
-        prompt += (
+        parts.append(
             f"\n\nCurrent date and time: {current_datetime}\n"
             "(Earlier messages are prefixed with the time they were sent; that "
             "bracketed timestamp is metadata, not part of the message text.)"
         )
         if memory_context:
-            prompt += memory_context
+            parts.append(memory_context)
 
-        return prompt
+        return "".join(parts)
 
 
 __all__ = ["ChatSystemPromptBuilder", "SystemPromptContext"]
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCall:
     id: str
     name: str
@@ -21,14 +21,14 @@ class ToolCall:
     parse_error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Usage:
     input_tokens: int = 0
     output_tokens: int = 0
     context_pressure: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     content: str
     tool_calls: list[ToolCall] = field(default_factory=list)
@@ -274,7 +274,10 @@ class SkillStore:
     """File-backed store of skills under `~/.anton/skills/` (by default).
 
     Each skill is a directory whose name is its `label` (hyphen-case).
-    The store is stateless — reads from disk on demand.
+    The store reads from disk on demand; the only state it keeps is a
+    parsed-frontmatter cache shared by load(), list_all() and
+    list_summaries(), keyed on each SKILL.md's mtime and size so edits
+    made outside this process are still seen.
     Legacy directories (meta.json + declarative.md) are migrated transparently
     on first access via check_migrate().
     """
@@ -289,6 +292,9 @@ class SkillStore:
         self.builtin_root = (
             Path(builtin_root) if builtin_root is not None else _BUILTIN_SKILLS_ROOT
         )
+        self._frontmatter_cache: dict[
+            Path, tuple[tuple[int, int], AgentSkill | None]
+        ] = {}
 
     # ── internal helpers ─────────────────────────────────────────────
 
@@ -312,7 +318,7 @@ class SkillStore:
 
     def _skill_from_dir(self, d: Path) -> Skill | None:
         """Build a Skill from a (already-migrated) directory."""
-        fm = parse_skill_dir(d)
+        fm = self._cached_frontmatter(d)
         if fm is None:
             return None
 
@@ -404,21 +410,41 @@ class SkillStore:
         """Lightweight listing for prompt-building.
 
         Returns dicts with keys: label, name, description.
-        Reads only SKILL.md frontmatter, skips the body.
+        Called on every prompt build and routing turn, so it relies on the
+        parsed-frontmatter cache shared with list_all() and load().
         """
         out: list[dict] = []
         for child in self._iter_skill_dirs():
-            fm = parse_skill_dir(child)
-            if fm is None:
-                continue
-            out.append({
-                "label": fm.name,
-                "name": fm.metadata.get("display_name", fm.name),
-                "description": fm.description,
-            })
+            fm = self._cached_frontmatter(child)
+            if fm is not None:
+                out.append({
+                    "label": fm.name,
+                    "name": fm.metadata.get("display_name", fm.name),
+                    "description": fm.description,
+                })
         out.sort(key=lambda s: s["label"])
         return out
 
+    def _cached_frontmatter(self, skill_dir: Path) -> AgentSkill | None:
+        """parse_skill_dir() memoised on SKILL.md's (mtime_ns, size).
+
+        The result is shared between callers and must not be mutated.
+        """
+        md_path = skill_dir / "SKILL.md"
+        try:
+            st = md_path.stat()
+        except OSError:
+            self._frontmatter_cache.pop(md_path, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._frontmatter_cache.get(md_path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+        fm = parse_skill_dir(skill_dir)
+        self._frontmatter_cache[md_path] = (stamp, fm)
+        return fm
+
     def _builtin_dirs(self) -> list[Path]:
         if not self.builtin_root.is_dir():
             return []
@@ -482,6 +508,8 @@ class SkillStore:
             metadata=metadata,
         )
         (d / "SKILL.md").write_text(dump_skill(fm), encoding="utf-8")
+        # A same-size rewrite can land within one mtime tick; don't trust the stamp.
+        self._frontmatter_cache.pop(d / "SKILL.md", None)
 
         stats_path = d / "stats.json"
         if not stats_path.is_file():
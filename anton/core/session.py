@@ -1025,8 +1025,7 @@ class ChatSession:
     def _build_tools(self) -> list[dict]:
         if not self.tool_registry:
             self._build_core_tools()
-            for tool in self._extra_tools:
-                self.tool_registry.register_tool(tool)
+            self.tool_registry.register_tools(self._extra_tools)
         return self.tool_registry.dump()
 
     def _build_core_tools(self) -> None:
@@ -1086,11 +1085,13 @@ class ChatSession:
         # would just return error strings — better to hide the tools
         # entirely so the LLM doesn't try to use them.
         if self._workspace is not None:
-            self.tool_registry.register_tool(CREATE_ARTIFACT_TOOL)
-            self.tool_registry.register_tool(LIST_ARTIFACTS_TOOL)
-            self.tool_registry.register_tool(OPEN_ARTIFACT_TOOL)
-            self.tool_registry.register_tool(UPDATE_ARTIFACT_METADATA_TOOL)
-            self.tool_registry.register_tool(LAUNCH_BACKEND_TOOL)
+            self.tool_registry.register_tools((
+                CREATE_ARTIFACT_TOOL,
+                LIST_ARTIFACTS_TOOL,
+                OPEN_ARTIFACT_TOOL,
+                UPDATE_ARTIFACT_METADATA_TOOL,
+                LAUNCH_BACKEND_TOOL,
+            ))
 
     async def close(self) -> None:
         """Clean up scratchpads and other resources."""
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from anton.core.session import ChatSession
     from anton.core.tools.tool_defs import ToolDef
 
@@ -13,44 +15,58 @@ class ToolRegistry:
     """
 
     def __init__(self) -> None:
-        self._tools: list[ToolDef] = []
+        # Keyed by tool name, in registration order. Schemas are built at
+        # registration so per-turn dump() calls don't rebuild them.
+        self._tools: dict[str, ToolDef] = {}
+        self._schemas: dict[str, dict] = {}
 
     def __bool__(self) -> bool:
         return bool(self._tools)
 
     def register_tool(self, tool_def: "ToolDef") -> None:
         """Register a tool. Skips duplicates by name."""
-        if any(t.name == tool_def.name for t in self._tools):
+        if tool_def.name in self._tools:
             return
-        self._tools.append(tool_def)
+        self._tools[tool_def.name] = tool_def
+        self._schemas[tool_def.name] = _tool_schema(tool_def)
+
+    def register_tools(self, tool_defs: "Iterable[ToolDef]") -> None:
+        """Register several tools at once. Skips duplicates by name."""
+        for tool_def in tool_defs:
+            self.register_tool(tool_def)
 
     def get_tool_defs(self) -> list["ToolDef"]:
         """Return registered ToolDef objects (for prompt injection, etc.)."""
-        return list(self._tools)
+        return list(self._tools.values())
 
     async def dispatch_tool(
         self, session: "ChatSession", tool_name: str, tc_input: dict
     ) -> "str | list[dict]":
         """Dispatch a tool call by name. Returns result text or multimodal blocks."""
-        tool_def = next((t for t in self._tools if t.name == tool_name), None)
+        tool_def = self._tools.get(tool_name)
         if tool_def is None:
             raise ValueError(f"Tool {tool_name} not found")
         return await tool_def.handler(session, tc_input)
 
     def unregister_tool(self, name: str) -> None:
         """Remove a tool by name. No-op if not found."""
-        self._tools = [t for t in self._tools if t.name != name]
+        self._tools.pop(name, None)
+        self._schemas.pop(name, None)
 
     def dump(self) -> list[dict]:
         """
         Dump the registry as a list of LLM-facing tool schemas.
         Excludes handler and prompt — those are internal only.
+
+        Schemas are built once per tool at registration; the returned list
+        is fresh but the dicts are shared, so callers must not mutate them.
         """
-        return [
-            {
-                "name": t.name,
-                "description": t.description,
-                "input_schema": t.input_schema,
-            }
-            for t in self._tools
-        ]
+        return list(self._schemas.values())
+
+
+def _tool_schema(tool_def: "ToolDef") -> dict:
+    return {
+        "name": tool_def.name,
+        "description": tool_def.description,
+        "input_schema": tool_def.input_schema,
+    }
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-import json
 import re
 import time
 from pathlib import Path
 
+import orjson
+
+_SLUG_DROP_RE = re.compile(r"[^a-z0-9\s_]")
+_SLUG_SEP_RE = re.compile(r"[\s_]+")
+
 
 class LearningStore:
     """Manages learning files and the recall index under ~/.anton/learnings/."""
@@ -16,19 +20,16 @@ class LearningStore:
 
     def _read_index(self) -> dict[str, dict]:
         if self._index_path.exists():
-            return json.loads(self._index_path.read_text())
+            return orjson.loads(self._index_path.read_bytes())
         return {}
 
     def _write_index(self, index: dict[str, dict]) -> None:
-        self._index_path.write_text(json.dumps(index, indent=2))
+        self._index_path.write_bytes(orjson.dumps(index, option=orjson.OPT_INDENT_2))
 
     @staticmethod
     def _slugify(topic: str) -> str:
-        text = topic.lower()
-        text = re.sub(r"[^a-z0-9\s_]", "", text)
-        text = re.sub(r"[\s]+", "_", text.strip())
-        text = re.sub(r"_+", "_", text)
-        return text.strip("_") or "general"
+        text = _SLUG_DROP_RE.sub("", topic.lower())
+        return _SLUG_SEP_RE.sub("_", text).strip("_") or "general"
 
     async def record(self, topic: str, content: str, summary: str) -> None:
         slug = self._slugify(topic)
@@ -1,29 +1,124 @@
 from __future__ import annotations
 
+import heapq
 import json
+import math
+import os
+import tempfile
 import time
 import uuid
+from collections.abc import Iterator
 from pathlib import Path
+from typing import BinaryIO
+
+import orjson
+
+
+def _new_session_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def _has_non_finite(obj: object) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(v) for v in obj)
+    return False
+
+
+def _dumps(obj: object, *, indent: bool = False) -> bytes:
+    """Encode with orjson, falling back to stdlib json where the two differ.
+
+    orjson raises on lone surrogates and ints beyond 64 bits, and writes
+    NaN/Infinity as null; json.dumps keeps all of them as it always has.
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        data = orjson.dumps(obj, option=option)
+    except TypeError:
+        pass
+    else:
+        if b"null" not in data or not _has_non_finite(obj):
+            return data
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _loads(data: bytes):
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:  # NaN/Infinity or lone surrogates from json.dumps
+        return json.loads(data)
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write via a sibling temp file and os.replace, so readers never see a torn file."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
 
 
 class SessionStore:
-    """File-system session manager for ~/.anton/sessions/."""
+    """File-system session manager for ~/.anton/sessions/.
+
+    Sessions started here keep their transcript open until they are
+    completed or failed. An owner that can stop with sessions still
+    running must call ``aclose()`` to release those handles.
+    """
 
     def __init__(self, base_dir: Path) -> None:
         self._sessions_dir = base_dir / "sessions"
         self._sessions_dir.mkdir(parents=True, exist_ok=True)
         self._index_path = self._sessions_dir / "index.json"
+        # Append handles for sessions started here and still running, so each
+        # transcript entry is one write+flush instead of an open/write/close.
+        # Other sessions open and close per append, so handles are released
+        # by complete/fail (or aclose for sessions abandoned mid-run). Entries
+        # are never held back in memory; a crash loses nothing already appended.
+        self._transcripts: dict[str, BinaryIO] = {}
+        # Parsed index.json plus the (mtime_ns, size) it was read or written
+        # at. Reused while the file is unchanged, so a mutation costs one stat
+        # and one write; another store writing the same directory changes the
+        # stamp and forces a re-read.
+        self._index: list[dict] | None = None
+        self._index_stamp: tuple[int, int] | None = None
+        # meta.json contents for sessions started here and still running, so
+        # complete/fail rewrite it without reading it back first.
+        self._running_meta: dict[str, dict] = {}
+
+    def _stat_index(self) -> tuple[int, int] | None:
+        try:
+            st = self._index_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
 
     def _read_index(self) -> list[dict]:
-        if self._index_path.exists():
-            return json.loads(self._index_path.read_text())
-        return []
+        stamp = self._stat_index()
+        if self._index is None or stamp != self._index_stamp:
+            self._index = (
+                _loads(self._index_path.read_bytes()) if stamp is not None else []
+            )
+            self._index_stamp = stamp
+        return self._index
 
     def _write_index(self, index: list[dict]) -> None:
-        self._index_path.write_text(json.dumps(index, indent=2))
+        self._index = None  # a failed write must not leave a mirror newer than disk
+        _atomic_write_bytes(self._index_path, _dumps(index, indent=True))
+        self._index = index
+        self._index_stamp = self._stat_index()
 
     async def start_session(self, task: str) -> str:
-        session_id = uuid.uuid4().hex[:12]
+        session_id = _new_session_id()
         session_dir = self._sessions_dir / session_id
         session_dir.mkdir(parents=True, exist_ok=True)
 
@@ -34,7 +129,8 @@ class SessionStore:
             "started_at": time.time(),
             "completed_at": None,
         }
-        (session_dir / "meta.json").write_text(json.dumps(meta, indent=2))
+        _atomic_write_bytes(session_dir / "meta.json", _dumps(meta, indent=True))
+        self._running_meta[session_id] = meta
 
         # Append task entry to transcript
         await self.append(session_id, {"type": "task", "content": task})
@@ -60,26 +156,50 @@ class SessionStore:
         if "ts" not in entry:
             entry["ts"] = time.time()
 
-        line = json.dumps(entry) + "\n"
-        with open(transcript_path, "a") as f:
-            f.write(line)
+        line = _dumps(entry) + b"\n"
+        f = self._transcripts.get(session_id)
+        if f is None:
+            if session_id not in self._running_meta:
+                with open(transcript_path, "ab") as out:
+                    out.write(line)
+                return
+            f = self._transcripts[session_id] = open(transcript_path, "ab")
+        f.write(line)
+        f.flush()
+
+    def _close_transcript(self, session_id: str) -> None:
+        f = self._transcripts.pop(session_id, None)
+        if f is not None:
+            f.close()
+
+    async def aclose(self) -> None:
+        """Close transcript handles held open for running sessions."""
+        for session_id in list(self._transcripts):
+            self._close_transcript(session_id)
+
+    def _finish_meta(self, session_id: str, status: str, completed_at: float) -> None:
+        meta_path = self._sessions_dir / session_id / "meta.json"
+        meta = self._running_meta.pop(session_id, None)
+        if meta is None:  # started by another store instance
+            meta = _loads(meta_path.read_bytes())
+        meta["status"] = status
+        meta["completed_at"] = completed_at
+        _atomic_write_bytes(meta_path, _dumps(meta, indent=True))
 
     async def complete_session(self, session_id: str, summary: str) -> None:
         session_dir = self._sessions_dir / session_id
         now = time.time()
 
-        # Update meta.json
-        meta_path = session_dir / "meta.json"
-        meta = json.loads(meta_path.read_text())
-        meta["status"] = "completed"
-        meta["completed_at"] = now
-        meta_path.write_text(json.dumps(meta, indent=2))
+        try:
+            self._finish_meta(session_id, "completed", now)
 
-        # Write summary.md
-        (session_dir / "summary.md").write_text(summary)
+            # Write summary.md
+            _atomic_write_bytes(session_dir / "summary.md", summary.encode())
 
-        # Append completion entry to transcript
-        await self.append(session_id, {"type": "complete", "summary": summary})
+            # Append completion entry to transcript
+            await self.append(session_id, {"type": "complete", "summary": summary})
+        finally:
+            self._close_transcript(session_id)
 
         # Update index
         index = self._read_index()
@@ -92,18 +212,15 @@ class SessionStore:
         self._write_index(index)
 
     async def fail_session(self, session_id: str, error: str) -> None:
-        session_dir = self._sessions_dir / session_id
         now = time.time()
 
-        # Update meta.json
-        meta_path = session_dir / "meta.json"
-        meta = json.loads(meta_path.read_text())
-        meta["status"] = "failed"
-        meta["completed_at"] = now
-        meta_path.write_text(json.dumps(meta, indent=2))
+        try:
+            self._finish_meta(session_id, "failed", now)
 
-        # Append failure entry to transcript
-        await self.append(session_id, {"type": "failed", "error": error})
+            # Append failure entry to transcript
+            await self.append(session_id, {"type": "failed", "error": error})
+        finally:
+            self._close_transcript(session_id)
 
         # Update index
         index = self._read_index()
@@ -116,8 +233,11 @@ class SessionStore:
 
     def list_sessions(self, limit: int = 20) -> list[dict]:
         index = self._read_index()
-        # Return most recent first
-        return sorted(index, key=lambda e: e.get("started_at", 0), reverse=True)[:limit]
+        # Return most recent first; same order as a full reverse sort, but only
+        # the top `limit` entries are ever ordered.
+        recent = heapq.nlargest(limit, index, key=lambda e: e.get("started_at", 0))
+        # Copies, so callers can't edit the cached index behind our back.
+        return [dict(e) for e in recent]
 
     def get_session(self, session_id: str) -> dict | None:
         session_dir = self._sessions_dir / session_id
@@ -125,36 +245,40 @@ class SessionStore:
         if not meta_path.exists():
             return None
 
-        meta = json.loads(meta_path.read_text())
+        meta = _loads(meta_path.read_bytes())
         summary_path = session_dir / "summary.md"
         if summary_path.exists():
-            meta["summary"] = summary_path.read_text()
+            meta["summary"] = summary_path.read_text(encoding="utf-8")
         return meta
 
     def get_transcript(self, session_id: str) -> list[dict]:
-        session_dir = self._sessions_dir / session_id
-        transcript_path = session_dir / "transcript.jsonl"
-        if not transcript_path.exists():
-            return []
+        return list(self.iter_transcript(session_id))
 
-        entries = []
-        for line in transcript_path.read_text().splitlines():
-            line = line.strip()
-            if line:
-                entries.append(json.loads(line))
-        return entries
+    def iter_transcript(self, session_id: str) -> Iterator[dict]:
+        """Yield transcript entries one line at a time, without loading the whole file."""
+        transcript_path = self._sessions_dir / session_id / "transcript.jsonl"
+        try:
+            f = open(transcript_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield _loads(line)
 
     def get_recent_summaries(self, limit: int = 3) -> list[str]:
         index = self._read_index()
-        completed = [
-            e for e in index if e.get("status") == "completed"
-        ]
-        completed.sort(key=lambda e: e.get("completed_at", 0), reverse=True)
+        completed = heapq.nlargest(
+            limit,
+            (e for e in index if e.get("status") == "completed"),
+            key=lambda e: e.get("completed_at", 0),
+        )
 
         summaries = []
-        for entry in completed[:limit]:
+        for entry in completed:
             session_dir = self._sessions_dir / entry["id"]
             summary_path = session_dir / "summary.md"
             if summary_path.exists():
-                summaries.append(summary_path.read_text())
+                summaries.append(summary_path.read_text(encoding="utf-8"))
         return summaries
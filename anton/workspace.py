@@ -9,6 +9,8 @@ Handles:
 from __future__ import annotations
 
 import os
+import stat
+from collections.abc import Mapping
 from datetime import datetime
 from pathlib import Path
 
@@ -24,6 +26,16 @@ Created: {date}
 """
 
 
+def _create_file(path: Path, content: str) -> bool:
+    """Create `path` with `content` unless it already exists. Returns True if created."""
+    try:
+        with path.open("x") as f:
+            f.write(content)
+    except FileExistsError:
+        return False
+    return True
+
+
 class Workspace:
     """Manages the .anton/ workspace directory and its files."""
 
@@ -33,9 +45,11 @@ class Workspace:
         self._anton_md = self._anton_dir / "anton.md"
         self._env_file = self._anton_dir / ".env"
         self._anton_md_last_read: datetime | None = None
-
-        settings = AntonSettings()
-        self._artifacts_dir = self._anton_dir / settings.artifacts_dir
+        # Resolved on first use: building AntonSettings reads the environment
+        # and .env files, which secret-vault and anton.md callers never need.
+        self._artifacts_dir: Path | None = None
+        # Parsed .env keyed on its (mtime_ns, size); see _read_env().
+        self._env_cache: tuple[tuple[int, int], dict[str, str]] | None = None
 
     @property
     def base(self) -> Path:
@@ -83,36 +97,40 @@ class Workspace:
         """Create the workspace structure. Returns list of actions taken."""
         actions: list[str] = []
 
-        # Create .anton/ directory and memory subdirectory
-        self._anton_dir.mkdir(parents=True, exist_ok=True)
-        (self._anton_dir / "memory").mkdir(exist_ok=True)
+        # Create .anton/ directory and memory subdirectory (one makedirs walk)
+        (self._anton_dir / "memory").mkdir(parents=True, exist_ok=True)
         actions.append(f"Created {self._anton_dir}")
 
-        # Create anton.md if it doesn't exist
-        if not self._anton_md.is_file():
-            self._anton_md.write_text(
-                ANTON_MD_TEMPLATE.format(date=datetime.now().strftime("%Y-%m-%d"))
-            )
+        # Create anton.md and .env if they don't exist. Exclusive-create
+        # opens instead of is_file() + write_text(): one syscall each, and
+        # a file created in between is never overwritten.
+        if _create_file(
+            self._anton_md,
+            ANTON_MD_TEMPLATE.format(date=datetime.now().strftime("%Y-%m-%d")),
+        ):
             actions.append(f"Created {self._anton_md}")
 
-        # Create .env if it doesn't exist
-        if not self._env_file.is_file():
-            self._env_file.write_text("# Anton environment variables\n")
+        if _create_file(self._env_file, "# Anton environment variables\n"):
             actions.append(f"Created {self._env_file}")
 
         # Visible artifacts directory at the workspace root. Replaces
         # the legacy hidden `.anton/output/` dump — one folder per
         # artifact, each owning its own metadata.json + README.md.
         # Idempotent: existing artifact subfolders are left alone.
-        if not self._artifacts_dir.exists():
-            self._artifacts_dir.mkdir(parents=True, exist_ok=True)
-            actions.append(f"Created {self._artifacts_dir}")
+        try:
+            self.artifacts_dir.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            actions.append(f"Created {self.artifacts_dir}")
 
         return actions
 
     @property
     def artifacts_dir(self) -> Path:
         """Where artifacts live. Created lazily by `initialize()`."""
+        if self._artifacts_dir is None:
+            self._artifacts_dir = self._anton_dir / AntonSettings().artifacts_dir
         return self._artifacts_dir
 
     # ── anton.md reading ─────────────────────────────────────────
@@ -155,9 +173,27 @@ class Workspace:
 
     def load_env(self) -> dict[str, str]:
         """Load all variables from .anton/.env. Returns key=value dict."""
+        return dict(self._read_env())
+
+    def _read_env(self) -> dict[str, str]:
+        """Parsed .env, reused while the file's mtime and size are unchanged.
+
+        Shared with get_secret(); callers must not mutate it. Our own writes
+        drop the cache explicitly, since a same-size rewrite can land within
+        one mtime tick.
+        """
+        try:
+            st = self._env_file.stat()
+        except OSError:
+            self._env_cache = None
+            return {}
+        if not stat.S_ISREG(st.st_mode):
+            return {}
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._env_cache is not None and self._env_cache[0] == stamp:
+            return self._env_cache[1]
+
         result: dict[str, str] = {}
-        if not self._env_file.is_file():
-            return result
         for line in self._env_file.read_text().splitlines():
             line = line.strip()
             if not line or line.startswith("#"):
@@ -165,12 +201,12 @@ class Workspace:
             if "=" in line:
                 key, _, value = line.partition("=")
                 result[key.strip()] = value.strip()
+        self._env_cache = (stamp, result)
         return result
 
     def get_secret(self, key: str) -> str | None:
         """Get a specific secret from .anton/.env."""
-        env = self.load_env()
-        return env.get(key)
+        return self._read_env().get(key)
 
     def has_secret(self, key: str) -> bool:
         """Check if a secret exists in .anton/.env."""
@@ -182,29 +218,40 @@ class Workspace:
         The value is written directly to the .env file, and the
         environment variable is set in the current process.
         """
+        self.set_secrets({key: value})
+
+    def set_secrets(self, secrets: Mapping[str, str]) -> None:
+        """Store several secrets in .anton/.env with one read and one write.
+
+        Existing keys are replaced in place and new keys are appended in the
+        order given; comments and other lines are kept as they are. Every
+        key is also set in the current process environment.
+        """
+        if not secrets:
+            return
         self._anton_dir.mkdir(parents=True, exist_ok=True)
 
         # Read existing lines
         lines: list[str] = []
-        replaced = False
+        replaced: set[str] = set()
         if self._env_file.is_file():
             for line in self._env_file.read_text().splitlines():
                 stripped = line.strip()
                 if stripped and not stripped.startswith("#") and "=" in stripped:
                     existing_key = stripped.partition("=")[0].strip()
-                    if existing_key == key:
-                        lines.append(f"{key}={value}")
-                        replaced = True
+                    if existing_key in secrets:
+                        lines.append(f"{existing_key}={secrets[existing_key]}")
+                        replaced.add(existing_key)
                         continue
                 lines.append(line)
 
-        if not replaced:
-            lines.append(f"{key}={value}")
+        lines.extend(f"{k}={v}" for k, v in secrets.items() if k not in replaced)
 
         self._env_file.write_text("\n".join(lines) + "\n")
+        self._env_cache = None
 
         # Also set in current process environment
-        os.environ[key] = value
+        os.environ.update(secrets)
 
     def remove_secret(self, key: str) -> bool:
         """Remove a secret from .anton/.env.
@@ -227,6 +274,7 @@ class Workspace:
 
         if found:
             self._env_file.write_text("\n".join(lines) + "\n")
+            self._env_cache = None
             os.environ.pop(key, None)
 
         return found
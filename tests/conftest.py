@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import re
+import tempfile
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -30,6 +35,93 @@ def make_mock_llm() -> AsyncMock:
     return mock
 
 
+def scratch_workspace_base() -> Path:
+    """Repo-local scratch workspace for tests that spawn scratchpad venvs.
+
+    pytest runs sandboxed and can't write to the real home directory, so the
+    venvs live under ``.pytest-workspace/``. Under pytest-xdist each worker
+    gets its own subdirectory so parallel runs never build the same venv.
+    """
+    base = Path(__file__).resolve().parents[1] / ".pytest-workspace"
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if worker:
+        base = base / worker
+    base.mkdir(parents=True, exist_ok=True)
+    return base
+
+
+def make_mock_workspace() -> MagicMock:
+    """Return a MagicMock workspace rooted at :func:`scratch_workspace_base`.
+
+    ``ChatSession`` splices ``build_anton_md_context()`` into the system
+    prompt, so it returns an empty string rather than a child mock.
+    """
+    workspace = MagicMock(base=scratch_workspace_base())
+    workspace.build_anton_md_context.return_value = ""
+    return workspace
+
+
+_SHM_ROOT = Path("/dev/shm")
+
+
+@pytest.fixture()
+def shm_path(tmp_path_factory):
+    """Per-test scratch dir on tmpfs when available, else a pytest temp dir.
+
+    File-backed stores (sessions, learnings) write small JSON/Markdown files
+    on every call. Keeping those under ``/dev/shm`` on Linux avoids disk
+    writeback in the store tests. Only platforms without a writable
+    ``/dev/shm`` get an on-disk dir from ``tmp_path_factory``.
+    """
+    if not (_SHM_ROOT.is_dir() and os.access(_SHM_ROOT, os.W_OK)):
+        yield tmp_path_factory.mktemp("shm-fallback")
+        return
+    with tempfile.TemporaryDirectory(prefix="anton-test-", dir=_SHM_ROOT) as d:
+        yield Path(d)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop where it is installed.
+
+    uvloop is a dev-only dependency with no Windows build, so the stock
+    asyncio loop is used where it can't be imported.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+_PROFILE_TESTS = os.environ.get("ANTON_PROFILE_TESTS") == "1"
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    """Profile ``slow_profile`` tests when ``ANTON_PROFILE_TESTS=1`` is set.
+
+    Stats are written to ``.pytest-workspace/profiles/<test id>.pstats`` for
+    ``python -m pstats`` or snakeviz. Without the variable this is a plain
+    pass-through.
+    """
+    if not (_PROFILE_TESTS and item.get_closest_marker("slow_profile")):
+        return (yield)
+
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return (yield)
+    finally:
+        profiler.disable()
+        out = scratch_workspace_base() / "profiles"
+        out.mkdir(exist_ok=True)
+        name = re.sub(r"[^\w.-]+", "_", item.nodeid)
+        profiler.dump_stats(out / f"{name}.pstats")
+
+
 @pytest.fixture()
 def make_llm_response():
     def _factory(
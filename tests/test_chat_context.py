@@ -31,6 +31,11 @@ def _text_response(text: str) -> LLMResponse:
     )
 
 
+# Shared default reply for tests that only need *a* plain-text turn. The
+# session never mutates LLMResponse objects, so one instance is safe to reuse.
+_HELLO_RESPONSE = _text_response("Hello!")
+
+
 def _memorize_response(
     text: str, entries: list[dict], tool_id: str = "tc_mem_1"
 ) -> LLMResponse:
@@ -146,7 +151,7 @@ class TestMemorizeTool:
         hc.encode_rule("Use httpx instead of requests", kind="always", confidence="high", source="user")
 
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(llm_client=mock_llm, cortex=cortex))
         await session.turn("hi")
@@ -215,7 +220,7 @@ class TestAntonMdInjection:
         ws.anton_md_path.write_text("This project uses Django and PostgreSQL")
 
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(
             llm_client=mock_llm,
@@ -234,7 +239,7 @@ class TestAntonMdInjection:
         ws.anton_md_path.write_text("")
 
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(
             llm_client=mock_llm,
@@ -252,7 +257,7 @@ class TestRuntimeContext:
     async def test_runtime_context_injected_into_system_prompt(self):
         """Runtime context (provider/model) appears in the system prompt."""
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(
             llm_client=mock_llm,
@@ -269,7 +274,7 @@ class TestRuntimeContext:
     async def test_system_prompt_warns_not_to_ask_about_llm(self):
         """System prompt includes instruction to never ask which LLM to use."""
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(
             llm_client=mock_llm,
@@ -284,7 +289,7 @@ class TestRuntimeContext:
     async def test_conversation_discipline_in_prompt(self):
         """System prompt includes conversation discipline rules."""
         mock_llm = make_mock_llm()
-        mock_llm.plan = AsyncMock(return_value=_text_response("Hello!"))
+        mock_llm.plan = AsyncMock(return_value=_HELLO_RESPONSE)
 
         session = ChatSession(ChatSessionConfig(llm_client=mock_llm, system_prompt_context=SystemPromptContext()))
         await session.turn("hi")
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
-from tests.conftest import make_mock_llm
+from tests.conftest import make_mock_llm, make_mock_workspace
 
 import pytest
 
@@ -15,11 +14,7 @@ from anton.core.llm.provider import LLMResponse, StreamComplete, StreamToolResul
 
 @pytest.fixture()
 def workspace():
-    # Keep scratchpad venvs inside the repo workspace (pytest runs sandboxed and
-    # can't write to the real home directory).
-    base = Path(__file__).resolve().parents[1] / ".pytest-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    return MagicMock(base=base)
+    return make_mock_workspace()
 
 
 def _text_response(text: str) -> LLMResponse:
@@ -119,6 +114,7 @@ class TestScratchpadToolDefinition:
 
 
 class TestScratchpadExecViaChat:
+    @pytest.mark.slow_profile
     async def test_scratchpad_exec_via_chat(self, workspace):
         """exec action flows through and returns output."""
         mock_llm = make_mock_llm()
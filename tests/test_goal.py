@@ -1,7 +1,9 @@
-"""Tests for /goal argument parsing and ToolRegistry.unregister_tool."""
+"""Tests for /goal argument parsing and ToolRegistry registration helpers."""
 
 from __future__ import annotations
 
+import pytest
+
 from anton.commands.goal import parse_goal_args as _parse_goal_args
 from anton.core.tools.registry import ToolRegistry
 from anton.core.tools.tool_defs import ToolDef
@@ -69,8 +71,7 @@ def _make_tool(name: str) -> ToolDef:
 class TestUnregisterTool:
     def test_removes_named_tool(self):
         reg = ToolRegistry()
-        reg.register_tool(_make_tool("alpha"))
-        reg.register_tool(_make_tool("beta"))
+        reg.register_tools([_make_tool("alpha"), _make_tool("beta")])
         reg.unregister_tool("alpha")
         names = [t.name for t in reg.get_tool_defs()]
         assert "alpha" not in names
@@ -84,8 +85,7 @@ class TestUnregisterTool:
 
     def test_removes_only_matching_tool(self):
         reg = ToolRegistry()
-        for name in ("a", "b", "c"):
-            reg.register_tool(_make_tool(name))
+        reg.register_tools(_make_tool(name) for name in ("a", "b", "c"))
         reg.unregister_tool("b")
         names = [t.name for t in reg.get_tool_defs()]
         assert names == ["a", "c"]
@@ -101,3 +101,39 @@ class TestUnregisterTool:
         reg.register_tool(_make_tool("target"))
         reg.unregister_tool("target")
         assert reg.dump() == []
+
+
+class TestRegisterTools:
+    def test_registers_in_order(self):
+        reg = ToolRegistry()
+        reg.register_tools([_make_tool("a"), _make_tool("b")])
+        assert [t.name for t in reg.get_tool_defs()] == ["a", "b"]
+
+    def test_skips_existing_and_repeated_names(self):
+        reg = ToolRegistry()
+        reg.register_tool(_make_tool("a"))
+        first_b = _make_tool("b")
+        reg.register_tools([_make_tool("a"), first_b, _make_tool("b")])
+        tools = reg.get_tool_defs()
+        assert [t.name for t in tools] == ["a", "b"]
+        assert tools[1] is first_b
+
+    def test_dump_tracks_register_and_unregister(self):
+        reg = ToolRegistry()
+        reg.register_tools(_make_tool(name) for name in ("a", "b", "c"))
+        reg.unregister_tool("b")
+        reg.register_tool(_make_tool("b"))
+        assert [t["name"] for t in reg.dump()] == ["a", "c", "b"]
+        assert reg.dump()[0] == {
+            "name": "a",
+            "description": "tool a",
+            "input_schema": {"type": "object", "properties": {}},
+        }
+
+    async def test_dispatch_uses_registered_handler(self):
+        reg = ToolRegistry()
+        reg.register_tool(_make_tool("a"))
+        assert await reg.dispatch_tool(None, "a", {}) == ""
+        reg.unregister_tool("a")
+        with pytest.raises(ValueError, match="Tool a not found"):
+            await reg.dispatch_tool(None, "a", {})
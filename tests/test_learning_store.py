@@ -8,44 +8,49 @@ from anton.memory.learnings import LearningStore
 
 
 @pytest.fixture()
-def store(tmp_path):
-    return LearningStore(tmp_path)
+def store(shm_path):
+    return LearningStore(shm_path)
 
 
 class TestRecord:
-    async def test_creates_topic_file_and_updates_index(self, store, tmp_path):
+    async def test_creates_topic_file_and_updates_index(self, store, shm_path):
         await store.record("file_ops", "Always check if file exists", "Check file existence")
 
         # Topic file created
-        topic_file = tmp_path / "learnings" / "file_ops.md"
+        topic_file = shm_path / "learnings" / "file_ops.md"
         assert topic_file.exists()
         assert "Always check if file exists" in topic_file.read_text()
 
         # Index updated
-        index = json.loads((tmp_path / "learnings" / "index.json").read_text())
+        index = json.loads((shm_path / "learnings" / "index.json").read_text())
         assert "file_ops" in index
         assert index["file_ops"]["summary"] == "Check file existence"
         assert index["file_ops"]["updated_at"] > 0
 
-    async def test_appends_to_existing_topic(self, store, tmp_path):
+    async def test_appends_to_existing_topic(self, store, shm_path):
         await store.record("file_ops", "First learning", "Summary 1")
         await store.record("file_ops", "Second learning", "Summary 2")
 
-        topic_file = tmp_path / "learnings" / "file_ops.md"
+        topic_file = shm_path / "learnings" / "file_ops.md"
         content = topic_file.read_text()
         assert "First learning" in content
         assert "Second learning" in content
 
         # Index summary should be updated to latest
-        index = json.loads((tmp_path / "learnings" / "index.json").read_text())
+        index = json.loads((shm_path / "learnings" / "index.json").read_text())
         assert index["file_ops"]["summary"] == "Summary 2"
 
-    async def test_slugifies_topic_name(self, store, tmp_path):
+    async def test_slugifies_topic_name(self, store, shm_path):
         await store.record("File Operations!", "content", "summary")
 
-        topic_file = tmp_path / "learnings" / "file_operations.md"
+        topic_file = shm_path / "learnings" / "file_operations.md"
         assert topic_file.exists()
 
+    def test_slug_collapses_whitespace_and_underscores(self):
+        assert LearningStore._slugify("  File__ops \t tips_ ") == "file_ops_tips"
+        assert LearningStore._slugify("don't panic") == "dont_panic"
+        assert LearningStore._slugify("!!!") == "general"
+
 
 class TestFindRelevant:
     async def test_returns_matches_by_keyword_overlap(self, store):
@@ -80,6 +85,20 @@ class TestFindRelevant:
         assert "Detailed learning content here" in results[0]["content"]
 
 
+class TestIndexFormat:
+    def test_reads_index_written_by_stdlib_json(self, store, shm_path):
+        legacy = {"café": {"topic": "Café notes", "summary": "Résumé"}}
+        (shm_path / "learnings" / "index.json").write_text(json.dumps(legacy, indent=2))
+
+        assert store.list_all() == [{"topic": "Café notes", "summary": "Résumé"}]
+
+    async def test_index_round_trips_non_ascii(self, store, shm_path):
+        await store.record("naïve ops", "content", "Überblick")
+
+        index = json.loads((shm_path / "learnings" / "index.json").read_bytes())
+        assert index["nave_ops"]["summary"] == "Überblick"
+
+
 class TestListAll:
     async def test_returns_all_topics(self, store):
         await store.record("file_ops", "Content 1", "Summary 1")
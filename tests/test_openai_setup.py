@@ -143,7 +143,8 @@ class TestSetupCustomOpenAIAzure:
 
         assert settings.openai_api_version == "2024-12-01-preview"
         assert settings.planning_model == "gpt-4.1-mini"
-        workspace.set_secret.assert_any_call("ANTON_OPENAI_API_VERSION", "2024-12-01-preview")
+        saved = workspace.set_secrets.call_args.args[0]
+        assert saved["ANTON_OPENAI_API_VERSION"] == "2024-12-01-preview"
 
     def test_no_api_version_uses_standard_client(self, monkeypatch):
         """Blank api-version → regular openai.OpenAI, no AzureOpenAI."""
@@ -3,6 +3,8 @@ from __future__ import annotations
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
+
 from anton.core.llm.anthropic import AnthropicProvider
 from anton.core.llm.openai import _parse_response_object
 from anton.core.llm.provider import LLMResponse, ToolCall, compute_context_pressure
@@ -59,133 +61,117 @@ class TestDataclasses:
         assert r.stop_reason == "tool_use"
 
 
-class TestAnthropicProvider:
-    async def test_complete_text_response(self):
-        with patch("anton.core.llm.anthropic.anthropic") as mock_anthropic:
-            mock_client = AsyncMock()
-            mock_anthropic.AsyncAnthropic.return_value = mock_client
-
-            text_block = MagicMock()
-            text_block.type = "text"
-            text_block.text = "Hello world"
+@pytest.fixture()
+def anthropic_mock(monkeypatch):
+    """Stand-in for the ``anthropic`` SDK module as seen by AnthropicProvider.
 
-            mock_response = MagicMock()
-            mock_response.content = [text_block]
-            mock_response.usage.input_tokens = 5
-            mock_response.usage.output_tokens = 10
-            mock_response.stop_reason = "end_turn"
+    ``AsyncAnthropic()`` returns a shared ``AsyncMock`` client, so tests only
+    need to set ``messages.create`` on it.
+    """
+    fake = MagicMock()
+    fake.AsyncAnthropic.return_value = AsyncMock()
+    monkeypatch.setattr("anton.core.llm.anthropic.anthropic", fake)
+    return fake
 
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
 
-            provider = AnthropicProvider(api_key="test-key")
-            result = await provider.complete(
-                model="claude-sonnet-4-6",
-                system="be helpful",
-                messages=[{"role": "user", "content": "hi"}],
-            )
+def _anthropic_response(content, *, input_tokens=5, output_tokens=10, stop_reason="end_turn"):
+    return SimpleNamespace(
+        content=content,
+        usage=SimpleNamespace(input_tokens=input_tokens, output_tokens=output_tokens),
+        stop_reason=stop_reason,
+    )
 
-            assert result.content == "Hello world"
-            assert result.tool_calls == []
-            assert result.usage.input_tokens == 5
-            assert result.stop_reason == "end_turn"
 
-    async def test_complete_tool_use_response(self):
-        with patch("anton.core.llm.anthropic.anthropic") as mock_anthropic:
-            mock_client = AsyncMock()
-            mock_anthropic.AsyncAnthropic.return_value = mock_client
+def _text_block(text):
+    return SimpleNamespace(type="text", text=text)
 
-            tool_block = MagicMock()
-            tool_block.type = "tool_use"
-            tool_block.id = "tool_1"
-            tool_block.name = "create_plan"
-            tool_block.input = {"reasoning": "test"}
 
-            mock_response = MagicMock()
-            mock_response.content = [tool_block]
-            mock_response.usage.input_tokens = 15
-            mock_response.usage.output_tokens = 25
-            mock_response.stop_reason = "tool_use"
-
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
-
-            provider = AnthropicProvider(api_key="test-key")
-            result = await provider.complete(
-                model="claude-sonnet-4-6",
-                system="plan",
-                messages=[{"role": "user", "content": "do something"}],
-                tools=[{"name": "create_plan", "description": "plan", "input_schema": {}}],
-            )
-
-            assert result.content == ""
-            assert len(result.tool_calls) == 1
-            assert result.tool_calls[0].name == "create_plan"
-            assert result.tool_calls[0].input == {"reasoning": "test"}
-            assert result.stop_reason == "tool_use"
+class TestAnthropicProvider:
+    async def test_complete_text_response(self, anthropic_mock):
+        mock_client = anthropic_mock.AsyncAnthropic.return_value
+        mock_client.messages.create = AsyncMock(
+            return_value=_anthropic_response([_text_block("Hello world")])
+        )
 
-    async def test_complete_passes_tool_choice(self):
-        with patch("anton.core.llm.anthropic.anthropic") as mock_anthropic:
-            mock_client = AsyncMock()
-            mock_anthropic.AsyncAnthropic.return_value = mock_client
+        provider = AnthropicProvider(api_key="test-key")
+        result = await provider.complete(
+            model="claude-sonnet-4-6",
+            system="be helpful",
+            messages=[{"role": "user", "content": "hi"}],
+        )
 
-            text_block = MagicMock()
-            text_block.type = "text"
-            text_block.text = "ok"
+        assert result.content == "Hello world"
+        assert result.tool_calls == []
+        assert result.usage.input_tokens == 5
+        assert result.stop_reason == "end_turn"
 
-            mock_response = MagicMock()
-            mock_response.content = [text_block]
-            mock_response.usage.input_tokens = 5
-            mock_response.usage.output_tokens = 10
-            mock_response.stop_reason = "end_turn"
+    async def test_complete_tool_use_response(self, anthropic_mock):
+        mock_client = anthropic_mock.AsyncAnthropic.return_value
 
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+        tool_block = SimpleNamespace(
+            type="tool_use", id="tool_1", name="create_plan", input={"reasoning": "test"},
+        )
 
-            provider = AnthropicProvider(api_key="test-key")
-            tool_choice = {"type": "tool", "name": "my_tool"}
-            tools = [{"name": "my_tool", "description": "d", "input_schema": {"type": "object"}}]
-            await provider.complete(
-                model="claude-sonnet-4-6",
-                system="sys",
-                messages=[{"role": "user", "content": "hi"}],
-                tools=tools,
-                tool_choice=tool_choice,
+        mock_client.messages.create = AsyncMock(
+            return_value=_anthropic_response(
+                [tool_block], input_tokens=15, output_tokens=25, stop_reason="tool_use",
             )
+        )
 
-            call_kwargs = mock_client.messages.create.call_args[1]
-            assert call_kwargs["tool_choice"] == tool_choice
-            assert call_kwargs["tools"] == tools
+        provider = AnthropicProvider(api_key="test-key")
+        result = await provider.complete(
+            model="claude-sonnet-4-6",
+            system="plan",
+            messages=[{"role": "user", "content": "do something"}],
+            tools=[{"name": "create_plan", "description": "plan", "input_schema": {}}],
+        )
 
-    async def test_complete_omits_tool_choice_when_none(self):
-        with patch("anton.core.llm.anthropic.anthropic") as mock_anthropic:
-            mock_client = AsyncMock()
-            mock_anthropic.AsyncAnthropic.return_value = mock_client
+        assert result.content == ""
+        assert len(result.tool_calls) == 1
+        assert result.tool_calls[0].name == "create_plan"
+        assert result.tool_calls[0].input == {"reasoning": "test"}
+        assert result.stop_reason == "tool_use"
+
+    async def test_complete_passes_tool_choice(self, anthropic_mock):
+        mock_client = anthropic_mock.AsyncAnthropic.return_value
+        mock_client.messages.create = AsyncMock(
+            return_value=_anthropic_response([_text_block("ok")])
+        )
 
-            text_block = MagicMock()
-            text_block.type = "text"
-            text_block.text = "ok"
+        provider = AnthropicProvider(api_key="test-key")
+        tool_choice = {"type": "tool", "name": "my_tool"}
+        tools = [{"name": "my_tool", "description": "d", "input_schema": {"type": "object"}}]
+        await provider.complete(
+            model="claude-sonnet-4-6",
+            system="sys",
+            messages=[{"role": "user", "content": "hi"}],
+            tools=tools,
+            tool_choice=tool_choice,
+        )
 
-            mock_response = MagicMock()
-            mock_response.content = [text_block]
-            mock_response.usage.input_tokens = 5
-            mock_response.usage.output_tokens = 10
-            mock_response.stop_reason = "end_turn"
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert call_kwargs["tool_choice"] == tool_choice
+        assert call_kwargs["tools"] == tools
 
-            mock_client.messages.create = AsyncMock(return_value=mock_response)
+    async def test_complete_omits_tool_choice_when_none(self, anthropic_mock):
+        mock_client = anthropic_mock.AsyncAnthropic.return_value
+        mock_client.messages.create = AsyncMock(
+            return_value=_anthropic_response([_text_block("ok")])
+        )
 
-            provider = AnthropicProvider(api_key="test-key")
-            await provider.complete(
-                model="claude-sonnet-4-6",
-                system="sys",
-                messages=[{"role": "user", "content": "hi"}],
-            )
+        provider = AnthropicProvider(api_key="test-key")
+        await provider.complete(
+            model="claude-sonnet-4-6",
+            system="sys",
+            messages=[{"role": "user", "content": "hi"}],
+        )
 
-            call_kwargs = mock_client.messages.create.call_args[1]
-            assert "tool_choice" not in call_kwargs
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert "tool_choice" not in call_kwargs
 
-    async def test_provider_without_api_key(self):
-        with patch("anton.core.llm.anthropic.anthropic") as mock_anthropic:
-            mock_anthropic.AsyncAnthropic.return_value = AsyncMock()
-            provider = AnthropicProvider()
-            mock_anthropic.AsyncAnthropic.assert_called_once_with()
+    async def test_provider_without_api_key(self, anthropic_mock):
+        AnthropicProvider()
+        anthropic_mock.AsyncAnthropic.assert_called_once_with()
 
 
 class _FakeAnthropicStream:
@@ -302,16 +288,8 @@ class TestAnthropicProviderReasoningStream:
 
 
 def _stub_text_response(text: str = "ok"):
-    """Build a MagicMock response that looks like a plain text Anthropic reply."""
-    block = MagicMock()
-    block.type = "text"
-    block.text = text
-    response = MagicMock()
-    response.content = [block]
-    response.usage.input_tokens = 1
-    response.usage.output_tokens = 1
-    response.stop_reason = "end_turn"
-    return response
+    """Build a stub response that looks like a plain text Anthropic reply."""
+    return _anthropic_response([_text_block(text)], input_tokens=1, output_tokens=1)
 
 
 class TestAnthropicNativeWebTools:
@@ -459,6 +459,39 @@ class TestScratchpadEnvironment:
         finally:
             await pad.close()
 
+    async def test_agentic_loop_threads_tool_results(self):
+        """Each tool turn adds an assistant tool_use message and a user tool_result message."""
+        pad = make_scratchpad(name="agentic-turns", coding_model="claude-test-model")
+        await pad.start()
+        try:
+            code = (
+                "from types import SimpleNamespace as NS\n"
+                "seen = []\n"
+                "replies = iter([\n"
+                "    NS(content='thinking', tool_calls=[NS(id='t1', name='add', input={'a': 1})]),\n"
+                "    NS(content='done', tool_calls=[]),\n"
+                "])\n"
+                "def fake_complete(*, messages, **kw):\n"
+                "    seen.append([dict(m) for m in messages])\n"
+                "    return next(replies)\n"
+                "get_llm().complete = fake_complete\n"
+                "out = agentic_loop(system='s', user_message='go', tools=[],\n"
+                "                   handle_tool=lambda name, inp: f'{name}={inp[\"a\"]}')\n"
+                "last = seen[-1]\n"
+                "print(out, len(last), [m['role'] for m in last])\n"
+                "print([b['type'] for b in last[1]['content']], last[2]['content'][0])\n"
+            )
+            cell = await pad.execute(code)
+            assert cell.error is None
+            first, second = cell.stdout.strip().splitlines()
+            assert first == "done 3 ['user', 'assistant', 'user']"
+            assert second == (
+                "['text', 'tool_use'] "
+                "{'type': 'tool_result', 'tool_use_id': 't1', 'content': 'add=1'}"
+            )
+        finally:
+            await pad.close()
+
     async def test_agentic_loop_not_available_without_model(self):
         """agentic_loop() should not be in namespace when no model is configured."""
         pad = make_scratchpad(name="no-agentic")
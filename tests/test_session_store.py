@@ -1,53 +1,74 @@
 from __future__ import annotations
 
+import itertools
 import json
+from pathlib import Path
 
 import pytest
 
+from anton.memory import store as store_mod
 from anton.memory.store import SessionStore
 
 
+@pytest.fixture(autouse=True)
+def _deterministic_session_ids(monkeypatch):
+    """Hand out sequential session ids instead of drawing from os.urandom."""
+    counter = itertools.count()
+    monkeypatch.setattr(store_mod, "_new_session_id", lambda: f"{next(counter):012x}")
+
+
 @pytest.fixture()
-def store(tmp_path):
-    return SessionStore(tmp_path)
+async def store(shm_path):
+    store = SessionStore(shm_path)
+    yield store
+    await store.aclose()
 
 
 class TestStartSession:
-    async def test_creates_directory_and_files(self, store, tmp_path):
+    async def test_creates_directory_and_files(self, store, shm_path):
         session_id = await store.start_session("test task")
 
-        session_dir = tmp_path / "sessions" / session_id
+        session_dir = shm_path / "sessions" / session_id
         assert session_dir.exists()
         assert (session_dir / "meta.json").exists()
         assert (session_dir / "transcript.jsonl").exists()
 
-    async def test_meta_json_content(self, store, tmp_path):
+    async def test_meta_json_content(self, store, shm_path):
         session_id = await store.start_session("test task")
 
-        meta = json.loads((tmp_path / "sessions" / session_id / "meta.json").read_text())
+        meta = json.loads((shm_path / "sessions" / session_id / "meta.json").read_text())
         assert meta["id"] == session_id
         assert meta["task"] == "test task"
         assert meta["status"] == "running"
         assert meta["started_at"] > 0
         assert meta["completed_at"] is None
 
-    async def test_updates_index(self, store, tmp_path):
+    async def test_updates_index(self, store, shm_path):
         session_id = await store.start_session("test task")
 
-        index = json.loads((tmp_path / "sessions" / "index.json").read_text())
+        index = json.loads((shm_path / "sessions" / "index.json").read_text())
         assert len(index) == 1
         assert index[0]["id"] == session_id
         assert index[0]["task"] == "test task"
         assert index[0]["status"] == "running"
 
+    async def test_task_with_lone_surrogate(self, store, shm_path):
+        task = "x\ud800"
+        session_id = await store.start_session(task)
+        await store.complete_session(session_id, "done")
+
+        assert store.get_session(session_id)["task"] == task
+        assert store.get_transcript(session_id)[0]["content"] == task
+        assert SessionStore(shm_path).list_sessions()[0]["task"] == task
+
 
 class TestAppend:
-    async def test_writes_to_transcript(self, store, tmp_path):
+    async def test_writes_to_transcript(self, store, shm_path):
         session_id = await store.start_session("test task")
 
         await store.append(session_id, {"type": "plan", "reasoning": "do stuff"})
 
-        transcript_path = tmp_path / "sessions" / session_id / "transcript.jsonl"
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
         lines = transcript_path.read_text().strip().splitlines()
         # First line is the task entry, second is our appended entry
         assert len(lines) == 2
@@ -56,23 +77,92 @@ class TestAppend:
         assert entry["reasoning"] == "do stuff"
         assert "ts" in entry
 
-    async def test_preserves_existing_entries(self, store, tmp_path):
+    async def test_accepts_entries_stdlib_json_accepts(self, store, shm_path):
+        session_id = await store.start_session("test task")
+        await store.append(session_id, {"type": "note", 1: "int key"})
+        await store.append(session_id, {"type": "note", "n": 2**70})
+
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
+        lines = transcript_path.read_text().splitlines()
+        assert json.loads(lines[1])["1"] == "int key"
+        assert json.loads(lines[2])["n"] == 2**70
+
+    async def test_non_finite_floats_round_trip(self, store):
+        session_id = await store.start_session("test task")
+        await store.append(session_id, {"type": "note", "score": float("nan"), "cap": float("inf")})
+
+        entry = store.get_transcript(session_id)[1]
+        assert entry["score"] != entry["score"]
+        assert entry["cap"] == float("inf")
+
+    async def test_preserves_existing_entries(self, store, shm_path):
         session_id = await store.start_session("test task")
         await store.append(session_id, {"type": "step", "index": 0})
         await store.append(session_id, {"type": "step", "index": 1})
 
-        transcript_path = tmp_path / "sessions" / session_id / "transcript.jsonl"
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
         lines = transcript_path.read_text().strip().splitlines()
         # task + 2 steps
         assert len(lines) == 3
 
+    async def test_reuses_one_handle_per_running_session(self, store, monkeypatch):
+        import builtins
+
+        session_id = await store.start_session("test task")
+        opened: list[str] = []
+        real_open = builtins.open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return real_open(path, *args, **kwargs)
+
+        monkeypatch.setattr(builtins, "open", tracking_open)
+        for i in range(5):
+            await store.append(session_id, {"type": "step", "index": i})
+        assert not any(p.endswith("transcript.jsonl") for p in opened)
+
+    async def test_handle_closed_when_session_ends(self, store):
+        s1 = await store.start_session("task 1")
+        s2 = await store.start_session("task 2")
+        await store.complete_session(s1, "done")
+        await store.fail_session(s2, "broke")
+        assert store._transcripts == {}
+
+        # A late append on an ended session reopens and still lands on disk.
+        await store.append(s1, {"type": "note"})
+        assert store.get_transcript(s1)[-1]["type"] == "note"
+        assert store._transcripts == {}
+
+    async def test_handle_closed_when_ending_a_session_fails(self, store, monkeypatch):
+        s1 = await store.start_session("task 1")
+        s2 = await store.start_session("task 2")
+
+        def broken_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store_mod.os, "replace", broken_replace)
+        with pytest.raises(OSError):
+            await store.complete_session(s1, "done")
+        with pytest.raises(OSError):
+            await store.fail_session(s2, "broke")
+        assert store._transcripts == {}
+
+    async def test_no_handle_kept_for_sessions_started_elsewhere(self, store, shm_path):
+        other = SessionStore(shm_path)
+        session_id = await other.start_session("test task")
+        await other.aclose()
+
+        await store.append(session_id, {"type": "note"})
+        assert store._transcripts == {}
+        assert store.get_transcript(session_id)[-1]["type"] == "note"
+
 
 class TestCompleteSession:
-    async def test_updates_meta_and_writes_summary(self, store, tmp_path):
+    async def test_updates_meta_and_writes_summary(self, store, shm_path):
         session_id = await store.start_session("test task")
         await store.complete_session(session_id, "Task completed successfully")
 
-        session_dir = tmp_path / "sessions" / session_id
+        session_dir = shm_path / "sessions" / session_id
         meta = json.loads((session_dir / "meta.json").read_text())
         assert meta["status"] == "completed"
         assert meta["completed_at"] is not None
@@ -80,30 +170,53 @@ class TestCompleteSession:
         summary = (session_dir / "summary.md").read_text()
         assert summary == "Task completed successfully"
 
-    async def test_updates_index_with_summary_preview(self, store, tmp_path):
+    async def test_does_not_read_back_meta_it_wrote(self, store, monkeypatch):
+        session_id = await store.start_session("test task")
+        real_read_bytes = Path.read_bytes
+
+        def guarded_read_bytes(self):
+            assert self.name != "meta.json"
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", guarded_read_bytes)
+        await store.complete_session(session_id, "done")
+        monkeypatch.undo()
+        assert store.get_session(session_id)["status"] == "completed"
+
+    async def test_completes_session_started_by_another_store(self, store, shm_path):
+        other = SessionStore(shm_path)
+        session_id = await other.start_session("test task")
+        await other.aclose()
+
+        await store.complete_session(session_id, "done")
+        meta = store.get_session(session_id)
+        assert meta["status"] == "completed"
+        assert meta["task"] == "test task"
+
+    async def test_updates_index_with_summary_preview(self, store, shm_path):
         session_id = await store.start_session("test task")
         await store.complete_session(session_id, "Task completed successfully")
 
-        index = json.loads((tmp_path / "sessions" / "index.json").read_text())
+        index = json.loads((shm_path / "sessions" / "index.json").read_text())
         assert index[0]["status"] == "completed"
         assert index[0]["summary_preview"] == "Task completed successfully"
 
 
 class TestFailSession:
-    async def test_updates_status_to_failed(self, store, tmp_path):
+    async def test_updates_status_to_failed(self, store, shm_path):
         session_id = await store.start_session("test task")
         await store.fail_session(session_id, "Something broke")
 
-        session_dir = tmp_path / "sessions" / session_id
+        session_dir = shm_path / "sessions" / session_id
         meta = json.loads((session_dir / "meta.json").read_text())
         assert meta["status"] == "failed"
         assert meta["completed_at"] is not None
 
-    async def test_updates_index(self, store, tmp_path):
+    async def test_updates_index(self, store, shm_path):
         session_id = await store.start_session("test task")
         await store.fail_session(session_id, "Something broke")
 
-        index = json.loads((tmp_path / "sessions" / "index.json").read_text())
+        index = json.loads((shm_path / "sessions" / "index.json").read_text())
         assert index[0]["status"] == "failed"
 
 
@@ -118,10 +231,75 @@ class TestListSessions:
         # Most recent first
         assert sessions[0]["task"] == "task 3"
 
+    async def test_orders_by_start_time_not_index_position(self, store, shm_path):
+        index = [
+            {"id": "b", "task": "middle", "started_at": 2.0},
+            {"id": "c", "task": "newest", "started_at": 3.0},
+            {"id": "a", "task": "oldest", "started_at": 1.0},
+        ]
+        (shm_path / "sessions" / "index.json").write_text(json.dumps(index))
+
+        assert [s["task"] for s in store.list_sessions(limit=2)] == ["newest", "middle"]
+
     async def test_empty_when_no_sessions(self, store):
         assert store.list_sessions() == []
 
 
+class TestIndexMirror:
+    async def test_lifecycle_does_not_reread_own_writes(self, store, monkeypatch):
+        reads: list[Path] = []
+        real_read_bytes = Path.read_bytes
+
+        def counting_read_bytes(self):
+            if self.name == "index.json":
+                reads.append(self)
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        sid = await store.start_session("task")
+        await store.complete_session(sid, "done")
+        store.list_sessions()
+        store.get_recent_summaries()
+        assert reads == []
+
+    async def test_sees_writes_from_another_store(self, store, shm_path):
+        await store.start_session("mine")
+        other = SessionStore(shm_path)
+        await other.start_session("theirs")
+        await other.aclose()
+
+        assert {s["task"] for s in store.list_sessions()} == {"mine", "theirs"}
+
+    async def test_listed_entries_are_copies(self, store):
+        await store.start_session("task")
+        store.list_sessions()[0]["status"] = "edited"
+        assert store.list_sessions()[0]["status"] == "running"
+
+
+class TestAtomicWrites:
+    async def test_failed_write_keeps_previous_file(self, store, shm_path, monkeypatch):
+        session_id = await store.start_session("test task")
+        meta_path = shm_path / "sessions" / session_id / "meta.json"
+        index_path = shm_path / "sessions" / "index.json"
+        before = (meta_path.read_bytes(), index_path.read_bytes())
+
+        def broken_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(store_mod.os, "replace", broken_replace)
+        with pytest.raises(OSError):
+            await store.complete_session(session_id, "done")
+
+        assert (meta_path.read_bytes(), index_path.read_bytes()) == before
+        assert not list((shm_path / "sessions").rglob("*.tmp"))
+
+    async def test_summary_round_trips_non_ascii(self, store):
+        session_id = await store.start_session("test task")
+        await store.complete_session(session_id, "Résumé ✓")
+        assert store.get_session(session_id)["summary"] == "Résumé ✓"
+        assert store.get_recent_summaries() == ["Résumé ✓"]
+
+
 class TestGetSession:
     async def test_returns_session_with_summary(self, store):
         session_id = await store.start_session("test task")
@@ -151,6 +329,37 @@ class TestGetTranscript:
     async def test_returns_empty_for_missing_session(self, store):
         assert store.get_transcript("nonexistent") == []
 
+    async def test_reads_lines_written_by_stdlib_json(self, store, shm_path):
+        session_id = await store.start_session("tâche")
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
+        with open(transcript_path, "a") as f:
+            f.write(json.dumps({"type": "note", "text": "café"}) + "\n")
+
+        transcript = store.get_transcript(session_id)
+        assert transcript[0]["content"] == "tâche"
+        assert transcript[1]["text"] == "café"
+
+    async def test_reads_nan_written_by_stdlib_json(self, store, shm_path):
+        session_id = await store.start_session("test task")
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
+        with open(transcript_path, "a") as f:
+            f.write(json.dumps({"type": "note", "score": float("nan")}) + "\n")
+
+        score = store.get_transcript(session_id)[1]["score"]
+        assert score != score
+
+    async def test_iter_transcript_is_lazy_and_skips_blank_lines(self, store, shm_path):
+        session_id = await store.start_session("test task")
+        transcript_path = shm_path / "sessions" / session_id / "transcript.jsonl"
+        with open(transcript_path, "ab") as f:
+            f.write(b"\n   \n")
+        await store.append(session_id, {"type": "step", "index": 0})
+
+        entries = store.iter_transcript(session_id)
+        assert next(entries)["type"] == "task"
+        assert [e["type"] for e in entries] == ["step"]
+        assert list(store.iter_transcript("nonexistent")) == []
+
 
 class TestGetRecentSummaries:
     async def test_returns_summaries_from_completed_sessions(self, store):
@@ -23,12 +23,11 @@ What must hold now:
 
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
-from tests.conftest import make_mock_llm
+from tests.conftest import make_mock_llm, make_mock_workspace
 
 from anton.core.llm.provider import (
     LLMResponse,
@@ -51,11 +50,7 @@ BUDGET = 8192
 
 @pytest.fixture()
 def workspace():
-    # Keep scratchpad venvs inside the repo workspace (pytest runs sandboxed
-    # and can't write to the real home directory).
-    base = Path(__file__).resolve().parents[1] / ".pytest-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    return MagicMock(base=base)
+    return make_mock_workspace()
 
 
 def _response(
@@ -175,6 +175,69 @@ class TestListing:
             "description": "Load a CSV, infer schema, compute summary stats.",
         }
 
+    def test_list_summaries_reuses_parsed_frontmatter(
+        self, store: SkillStore, monkeypatch
+    ):
+        import anton.core.memory.skills as skills_mod
+
+        store.save(_make_skill())
+        calls: list[Path] = []
+        real_parse = skills_mod.parse_skill_dir
+
+        def counting_parse(d: Path):
+            calls.append(d)
+            return real_parse(d)
+
+        monkeypatch.setattr(skills_mod, "parse_skill_dir", counting_parse)
+        first = store.list_summaries()
+        second = store.list_summaries()
+        assert first == second
+        assert len(calls) == len(first)
+
+    def test_list_all_and_load_share_the_parse_cache(
+        self, store: SkillStore, monkeypatch
+    ):
+        import anton.core.memory.skills as skills_mod
+
+        store.save(_make_skill())
+        calls: list[Path] = []
+        real_parse = skills_mod.parse_skill_dir
+
+        def counting_parse(d: Path):
+            calls.append(d)
+            return real_parse(d)
+
+        monkeypatch.setattr(skills_mod, "parse_skill_dir", counting_parse)
+        store.list_summaries()
+        n = len(calls)
+        assert [s.label for s in store.list_all()] == ["csv-summary"]
+        assert store.load("csv-summary") is not None
+        assert len(calls) == n
+
+    def test_list_summaries_sees_edits_after_caching(
+        self, store: SkillStore, store_root: Path
+    ):
+        store.save(_make_skill())
+        assert store.list_summaries()[0]["name"] == "CSV Summary"
+        store.save(_make_skill(name="CSV Overview plus"))
+        assert store.list_summaries()[0]["name"] == "CSV Overview plus"
+        store.delete("csv-summary")
+        assert store.list_summaries() == []
+
+    def test_save_refreshes_same_size_rewrite(self, store: SkillStore, store_root: Path):
+        import os
+
+        md_path = store_root / "csv-summary" / "SKILL.md"
+        store.save(_make_skill(name="CSV Summary A"))
+        assert store.list_summaries()[0]["name"] == "CSV Summary A"
+        before = md_path.stat()
+
+        # Same size and, once mtime is restored, the same stamp as the cached parse.
+        store.save(_make_skill(name="CSV Summary B"))
+        os.utime(md_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+        assert md_path.stat().st_size == before.st_size
+        assert store.list_summaries()[0]["name"] == "CSV Summary B"
+
     def test_delete_removes_directory(self, store: SkillStore, store_root: Path):
         store.save(_make_skill())
         assert (store_root / "csv-summary").is_dir()
@@ -11,12 +11,11 @@ to proceed.
 
 from __future__ import annotations
 
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 import pytest
 
-from tests.conftest import make_mock_llm
+from tests.conftest import make_mock_llm, make_mock_workspace
 
 from anton.core.session import ChatSession, ChatSessionConfig
 from anton.core.llm.provider import (
@@ -30,11 +29,7 @@ from anton.core.llm.provider import (
 
 @pytest.fixture()
 def workspace():
-    # Keep scratchpad venvs inside the repo workspace (pytest runs sandboxed and
-    # can't write to the real home directory).
-    base = Path(__file__).resolve().parents[1] / ".pytest-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    return MagicMock(base=base)
+    return make_mock_workspace()
 
 
 def _text_response(text: str) -> LLMResponse:
@@ -196,6 +191,7 @@ async def test_truncation_exhausting_every_budget_also_gets_the_diagnosis(worksp
         await session.close()
 
 
+@pytest.mark.slow_profile
 async def test_empty_diagnosis_is_logged_not_circular(workspace, caplog):
     """Review follow-up: an empty diagnosis must not silently recreate the
     out-of-sync history this path fixes — it logs, and the post-loop fallback
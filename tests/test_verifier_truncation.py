@@ -23,7 +23,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tests.conftest import make_mock_llm
+from tests.conftest import make_mock_llm, make_mock_workspace
 
 from anton.core.llm.client import LLMClient
 from anton.core.llm.provider import (
@@ -44,11 +44,7 @@ from anton.core.session import (
 
 @pytest.fixture()
 def workspace():
-    # Keep scratchpad venvs inside the repo workspace (pytest runs sandboxed and
-    # can't write to the real home directory).
-    base = Path(__file__).resolve().parents[1] / ".pytest-workspace"
-    base.mkdir(parents=True, exist_ok=True)
-    return MagicMock(base=base)
+    return make_mock_workspace()
 
 
 def _text_response(text: str, output_tokens: int = 20, stop_reason: str = "end_turn") -> LLMResponse:
@@ -372,6 +368,7 @@ async def test_non_truncated_failure_is_not_retried(workspace):
     assert calls == [_VERIFIER_TOKEN_BUDGETS[0]], "must not pay for a hopeless retry"
 
 
+@pytest.mark.slow_profile
 async def test_attempts_are_bounded_and_repeat_each_turn(workspace):
     """Truncation retries are bounded by the budget list — and are re-tried on a
     later turn rather than latched off.
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -77,6 +78,14 @@ class TestInitialization:
         actions = ws.initialize()
         assert len(actions) == 4  # .anton/, anton.md, .env, artifacts/
 
+    def test_second_initialize_creates_nothing_new(self, ws, tmp_path):
+        ws.initialize()
+        (tmp_path / ".anton" / ".env").write_text("KEY=kept\n")
+        actions = ws.initialize()
+        assert actions == [f"Created {tmp_path / '.anton'}"]
+        assert (tmp_path / ".anton" / ".env").read_text() == "KEY=kept\n"
+        assert (tmp_path / ".anton" / "memory").is_dir()
+
     def test_creates_artifacts_dir(self, ws, tmp_path):
         ws.initialize()
         assert (tmp_path / ".anton" / "artifacts").is_dir()
@@ -84,6 +93,26 @@ class TestInitialization:
     def test_artifacts_dir_property(self, ws, tmp_path):
         assert ws.artifacts_dir == tmp_path / ".anton" / "artifacts"
 
+    def test_settings_loaded_only_for_artifacts_dir(self, tmp_path, monkeypatch):
+        import anton.workspace as workspace_mod
+
+        built: list[object] = []
+        real_settings = workspace_mod.AntonSettings
+
+        def counting_settings(*args, **kwargs):
+            built.append(object())
+            return real_settings(*args, **kwargs)
+
+        monkeypatch.setattr(workspace_mod, "AntonSettings", counting_settings)
+        ws = Workspace(tmp_path)
+        ws.set_secrets({})
+        ws.read_anton_md()
+        assert built == []
+
+        ws.initialize()
+        assert ws.artifacts_dir == tmp_path / ".anton" / "artifacts"
+        assert len(built) == 1
+
 
 class TestAntonMd:
     def test_read_none_when_missing(self, ws):
@@ -120,6 +149,12 @@ class TestAntonMd:
 
 
 class TestSecretVault:
+    @pytest.fixture(autouse=True)
+    def _isolated_environ(self):
+        """The vault writes os.environ; keep those writes out of other tests on this worker."""
+        with patch.dict(os.environ):
+            yield
+
     def test_load_env_empty(self, ws):
         assert ws.load_env() == {}
 
@@ -148,6 +183,64 @@ class TestSecretVault:
         assert ws.get_secret("A") == "1"
         assert ws.get_secret("B") == "2"
 
+    def test_set_secrets_writes_file_once(self, ws, tmp_path, monkeypatch):
+        env_file = tmp_path / ".anton" / ".env"
+        env_file.parent.mkdir()
+        env_file.write_text("# keep me\nANTON_TEST_BATCH_A=old\nOTHER=1\n")
+
+        writes: list[Path] = []
+        real_write_text = Path.write_text
+
+        def counting_write_text(self, *args, **kwargs):
+            writes.append(self)
+            return real_write_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "write_text", counting_write_text)
+        ws.set_secrets({"ANTON_TEST_BATCH_A": "new", "ANTON_TEST_BATCH_B": "added"})
+
+        assert writes == [env_file]
+        assert env_file.read_text() == (
+            "# keep me\nANTON_TEST_BATCH_A=new\nOTHER=1\nANTON_TEST_BATCH_B=added\n"
+        )
+        assert os.environ["ANTON_TEST_BATCH_A"] == "new"
+        assert os.environ["ANTON_TEST_BATCH_B"] == "added"
+
+    def test_set_secrets_empty_is_noop(self, ws, tmp_path):
+        ws.set_secrets({})
+        assert not (tmp_path / ".anton").exists()
+
+    def test_reads_reuse_parsed_env_until_it_changes(self, ws, tmp_path, monkeypatch):
+        ws.set_secret("ANTON_TEST_CACHED", "v1")
+        reads: list[Path] = []
+        real_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads.append(self)
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        assert ws.get_secret("ANTON_TEST_CACHED") == "v1"
+        assert ws.has_secret("ANTON_TEST_CACHED") is True
+        assert ws.load_env()["ANTON_TEST_CACHED"] == "v1"
+        assert len(reads) == 1
+
+        # Another process edits the file.
+        (tmp_path / ".anton" / ".env").write_text("ANTON_TEST_CACHED=second\n")
+        assert ws.get_secret("ANTON_TEST_CACHED") == "second"
+
+    def test_same_size_rewrite_is_not_served_stale(self, ws, tmp_path):
+        ws.set_secret("ANTON_TEST_CACHED", "aa")
+        assert ws.get_secret("ANTON_TEST_CACHED") == "aa"
+        ws.set_secret("ANTON_TEST_CACHED", "bb")
+        assert ws.get_secret("ANTON_TEST_CACHED") == "bb"
+        ws.remove_secret("ANTON_TEST_CACHED")
+        assert ws.has_secret("ANTON_TEST_CACHED") is False
+
+    def test_load_env_returns_a_copy(self, ws):
+        ws.set_secret("ANTON_TEST_CACHED", "v1")
+        ws.load_env()["ANTON_TEST_CACHED"] = "edited"
+        assert ws.get_secret("ANTON_TEST_CACHED") == "v1"
+
     def test_set_secret_updates_environ(self, ws, tmp_path):
         ws.set_secret("ANTON_TEST_SECRET_XYZ", "secretval")
         assert os.environ.get("ANTON_TEST_SECRET_XYZ") == "secretval"